@@ -1,19 +1,199 @@
 """
 Database Connection Module
 
-This module establishes and manages the MySQL database connection for the task management application.
+This module establishes and manages the MySQL connection pool for the task management application.
+The pool is created lazily on first use so that importing this module stays cheap.
 """
 
-import mysql.connector
-from decouple import config
+import threading
+from contextlib import contextmanager
 
-# Establish connection to MySQL database using credentials from environment variables
-db = mysql.connector.connect(
-    host=config("DB_HOST"),        # Database host address
-    user=config("DB_USER"),        # Database user credentials
-    password=config("DB_PASSWORD"), # Database password
-    database=config("DB_DATABASE")  # Target database name
-)
+# Connection pool, created on first use by _connect()
+_pool = None
+_pool_lock = threading.Lock()
 
-# Create a cursor object for executing SQL queries
-cursor = db.cursor()
\ No newline at end of file
+
+def _connect():
+    """
+    Create the MySQL connection pool on first use and return it.
+
+    mysql.connector and decouple are imported here rather than at module load,
+    so importing this module does not open any network connection.
+
+    :return: The shared MySQLConnectionPool
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            from mysql.connector.constants import ClientFlag
+            from mysql.connector.pooling import MySQLConnectionPool
+            from decouple import config
+
+            # Create a pool of reusable MySQL connections using credentials from environment variables
+            _pool = MySQLConnectionPool(
+                pool_name="tasks",              # Name identifying the pool
+                pool_size=config("DB_POOL_SIZE", default=8, cast=int),  # Maximum number of pooled connections
+                host=config("DB_HOST"),        # Database host address
+                user=config("DB_USER"),        # Database user credentials
+                password=config("DB_PASSWORD"), # Database password
+                database=config("DB_DATABASE"), # Target database name
+                use_pure=False,                 # Use the C extension for protocol handling
+                client_flags=[ClientFlag.FOUND_ROWS]  # Report matched rather than changed rows for UPDATE
+            )
+    return _pool
+
+
+# Per-thread storage for the connection owned by an active UnitOfWork
+_local = threading.local()
+
+
+@contextmanager
+def get_conn():
+    """
+    Borrow a connection from the pool for the duration of a with-block.
+
+    The connection is returned to the pool when the block exits, even if an
+    error was raised inside it. Inside an active UnitOfWork, the unit of
+    work's connection is reused instead so all statements share its transaction.
+
+    :return: Pooled MySQL connection
+    """
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        # The active UnitOfWork owns this connection and will close it
+        yield conn
+        return
+
+    conn = _connect().get_connection()
+    try:
+        yield conn
+    finally:
+        # Closing a pooled connection returns it to the pool
+        conn.close()
+
+
+class UnitOfWork():
+    """
+    Context manager that groups several database mutations into one transaction.
+
+    While the with-block is active, every get_conn() call on the same thread
+    reuses a single connection. The transaction is committed once when the
+    block exits normally and rolled back if an exception is raised. Task
+    mutators should be called with commit=False inside a unit of work.
+    """
+    def __enter__(self):
+        """
+        Borrow a connection and start a transaction.
+
+        :return: The UnitOfWork instance
+        """
+        self.conn = _connect().get_connection()
+        self.conn.start_transaction()
+        _local.conn = self.conn
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Commit or roll back the transaction and return the connection to the pool.
+
+        :return: False so that exceptions are never suppressed
+        """
+        _local.conn = None
+        try:
+            if exc_type is None:
+                self.conn.commit()
+            else:
+                self.conn.rollback()
+        finally:
+            self.conn.close()
+        return False
+
+
+# Secondary indexes on the columns used for sorting in Task.get_all and for
+# the exact-match ID prefix lookup in Task.get. The priority and status indexes
+# are composite so their ORDER BY ... due_date, id tie-breakers are also served
+# by the index (InnoDB appends the primary key to every secondary index).
+TASK_INDEXES = {
+    "idx_tasks_due": "due_date",
+    "idx_tasks_prio_due": "priority_level, due_date",
+    "idx_tasks_status_due": "status, due_date",
+    "idx_id_prefix": "id_prefix",
+}
+
+# Indexes made redundant by the composite indexes above
+TASK_DROPPED_INDEXES = ("idx_tasks_prio", "idx_tasks_status")
+
+# Columns stored as ENUMs whose declaration order matches the display sort order,
+# so ORDER BY on them sorts High > Medium > Low and Pending > In Progress > Completed.
+# migrate() carries each column's existing NOT NULL and DEFAULT over to the ENUM.
+TASK_ENUM_COLUMNS = {
+    "priority_level": "ENUM('High', 'Medium', 'Low')",
+    "status": "ENUM('Pending', 'In Progress', 'Completed')",
+}
+
+
+def migrate():
+    """
+    Apply schema changes required by the application.
+
+    Converts the TASK_ENUM_COLUMNS to ENUMs, adds the generated id_prefix
+    column, creates any missing indexes from TASK_INDEXES, and drops the
+    TASK_DROPPED_INDEXES on the tasks table. Safe to run on every startup since
+    changes that are already applied are skipped.
+
+    :return: True if successful, False otherwise
+    :raises: Catches and logs any database errors
+    """
+    try:
+        with get_conn() as conn, conn.cursor() as cursor:
+            # Convert priority/status to ENUMs if they are still plain strings
+            cursor.execute(
+                """SELECT column_name, column_type, is_nullable, column_default
+                   FROM information_schema.columns
+                   WHERE table_schema = DATABASE() AND table_name = 'tasks'"""
+            )
+            columns = {name: (column_type, is_nullable, default)
+                       for name, column_type, is_nullable, default in cursor}
+
+            modify = []
+            params = []
+            for column, definition in TASK_ENUM_COLUMNS.items():
+                column_type, is_nullable, default = columns.get(column, ("", "YES", None))
+                if str(column_type).lower().startswith("enum"):
+                    continue
+                # MODIFY replaces the whole column definition, so restate the
+                # existing nullability and default
+                if is_nullable == "NO":
+                    definition += " NOT NULL"
+                if default is not None:
+                    definition += " DEFAULT %s"
+                    params.append(default)
+                modify.append(f"MODIFY {column} {definition}")
+            if modify:
+                cursor.execute(f"ALTER TABLE tasks {', '.join(modify)}", params)
+
+            # Store the first 8 characters of the ID for exact-match lookups
+            if "id_prefix" not in columns:
+                cursor.execute(
+                    "ALTER TABLE tasks ADD COLUMN id_prefix CHAR(8) "
+                    "GENERATED ALWAYS AS (LEFT(id, 8)) STORED"
+                )
+
+            # MySQL has no CREATE INDEX IF NOT EXISTS, so look up existing indexes first
+            cursor.execute(
+                """SELECT DISTINCT index_name FROM information_schema.statistics
+                   WHERE table_schema = DATABASE() AND table_name = 'tasks'"""
+            )
+            existing = {row[0] for row in cursor}
+
+            for name, index_columns in TASK_INDEXES.items():
+                if name not in existing:
+                    cursor.execute(f"CREATE INDEX {name} ON tasks ({index_columns})")
+
+            for name in TASK_DROPPED_INDEXES:
+                if name in existing:
+                    cursor.execute(f"DROP INDEX {name} ON tasks")
+        return True
+    except Exception as e:
+        print(f"Error migrating database: {e}")
+        return False
@@ -4,11 +4,132 @@ Main Application Entry Point
 This module serves as the entry point for the Task Management Application.
 """
 
-from models.task import Task
+import argparse
+import csv
+import datetime
+import sys
+from uuid import uuid4
+
+from db import UnitOfWork, migrate
+from models.task import VALID_STATUSES, Task
 from utils import TaskManager
 
+# Welcome banner and menu options, rendered once
+_BANNER = "\n".join([
+    "================================================",
+    "=  Welcome to the Task Management Application  =",
+    "================================================",
+    "",
+    "Choose from the following:",
+    "1. Add a new task",
+    "2. List all tasks with optional filtering.",
+    "3. Update a task's details.",
+    "4. Mark a task as completed.",
+    "5. Delete a task.",
+    "6. Exit",
+    "7. Delete multiple tasks.",
+]) + "\n"
+
+
+def run_batch(path):
+    """
+    Apply the task operations listed in a CSV file in one transaction.
+    
+    The file must have a header row with the columns
+    ``op,id,title,description,due_date,priority,status``. Supported operations:
+    - add: Insert a new task (id is generated when left empty)
+    - update: Set the non-empty title/description/due_date/priority/status
+      columns on the task with the given id
+    - status: Set the status of the task with the given id
+    - delete: Delete the task with the given id
+    
+    The id of an update, status or delete row may be the full ID or its
+    first 8 characters, and must match exactly one existing task (or one
+    added earlier in the same file). Operations are grouped by type and sent
+    through the batched Task APIs. If any row fails, the whole batch is
+    rolled back and the failing line is reported.
+    
+    :param path: Path to the CSV file
+    :return: True if successful, False otherwise
+    """
+    inserts = []
+    edits = []
+    updates = []
+    deletes = []
+    timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    
+    try:
+        with open(path, newline="") as batch_file:
+            for line, row in enumerate(csv.DictReader(batch_file), start=2):
+                op = (row.get("op") or "").strip().lower()
+                task_id = (row.get("id") or "").strip()
+                
+                if op == "add":
+                    inserts.append(Task(
+                        id=task_id or str(uuid4()),
+                        title=row["title"],
+                        description=row["description"],
+                        due_date=row["due_date"],
+                        priority=row["priority"],
+                        status=row.get("status") or "Pending",
+                        created_at=timestamp
+                    ))
+                elif op == "update":
+                    # Only columns with a value are changed
+                    fields = {
+                        field: row[field]
+                        for field in ("title", "description", "due_date", "priority", "status")
+                        if row.get(field)
+                    }
+                    edits.append((line, task_id, fields))
+                elif op == "status":
+                    if row["status"] not in VALID_STATUSES:
+                        raise ValueError(f"Line {line}: invalid status '{row['status']}'")
+                    updates.append((line, task_id, row["status"]))
+                elif op == "delete":
+                    deletes.append((line, task_id))
+                else:
+                    raise ValueError(f"Line {line}: unknown operation '{op}'")
+    except (OSError, KeyError, ValueError) as e:
+        print(f"Error reading batch file: {e}")
+        return False
+    
+    try:
+        # Commit every batched operation together, or none of them
+        with UnitOfWork():
+            if not Task.save_many(inserts, commit=False):
+                raise RuntimeError("could not add tasks")
+            
+            # Resolve every referenced ID once, after the inserts so rows added
+            # above can be referenced, and report the first line that matches nothing
+            referenced = [(line, task_id) for line, task_id, *_ in (*edits, *updates, *deletes)]
+            full_ids = Task.resolve_ids(task_id for _, task_id in referenced)
+            if full_ids is None:
+                raise RuntimeError("could not look up task IDs")
+            for line, task_id in sorted(referenced):
+                if task_id not in full_ids:
+                    raise RuntimeError(f"Line {line}: no task matches id '{task_id}'")
+                if full_ids[task_id] is None:
+                    raise RuntimeError(f"Line {line}: id prefix '{task_id}' matches several tasks")
+            
+            for line, task_id, fields in edits:
+                if not Task.update_by_id(full_ids[task_id], commit=False, **fields):
+                    raise RuntimeError(f"Line {line}: could not update task '{task_id}'")
+            if not Task.update_status_many(
+                    [(full_ids[task_id], status) for _, task_id, status in updates], commit=False):
+                raise RuntimeError("could not update task statuses")
+            if not Task.delete_many([full_ids[task_id] for _, task_id in deletes], commit=False):
+                raise RuntimeError("could not delete tasks")
+    except Exception as e:
+        print(f"Error applying batch, rolled back: {e}")
+        return False
+    
+    print(f"Batch applied: {len(inserts)} added, {len(edits)} updated, "
+          f"{len(updates)} status updates, {len(deletes)} deleted.")
+    return True
+
 
-def main():
+def main(argv=None):
     """
     Main function that runs the task management application.
     
@@ -17,30 +138,39 @@ def main():
     - View all tasks with sorting options
     - Update existing tasks
     - Mark tasks as completed
-    - Delete tasks
+    - Delete tasks, one at a time or several at once
     - Exit the application
+    
+    When started with ``--batch PATH``, applies the operations in the CSV file
+    non-interactively instead (see run_batch).
+    
+    :param argv: Command-line arguments (defaults to sys.argv[1:])
     """
+    parser = argparse.ArgumentParser(description="Task Management Application")
+    parser.add_argument("--batch", metavar="PATH", help="apply task operations from a CSV file and exit")
+    args = parser.parse_args(argv)
+    
     # Define valid menu choices
-    MAIN_CHOICES = "123456"
+    MAIN_CHOICES = "1234567"
+    
+    # Make sure the database schema is up to date; the Task queries depend on it
+    if not migrate():
+        print("Database migration failed. Exiting.")
+        sys.exit(1)
+    
+    # Non-interactive bulk mode
+    if args.batch:
+        if not run_batch(args.batch):
+            sys.exit(1)
+        return
     
     # Initialize the TaskManager for handling task operations
     tm = TaskManager()
     
     # Main application loop
     while True:
-        # Display welcome banner
-        print("================================================")
-        print("=  Welcome to the Task Management Application  =")
-        print("================================================")
-
-        # Display menu options
-        print("\nChoose from the following:")
-        print("1. Add a new task")
-        print("2. List all tasks with optional filtering.")
-        print("3. Update a task's details.")
-        print("4. Mark a task as completed.")
-        print("5. Delete a task.")
-        print("6. Exit")
+        # Display welcome banner and menu options with a single write
+        sys.stdout.write(_BANNER)
 
         # Get user input
         user = input("\nEnter your choice: ")
@@ -65,6 +195,9 @@ def main():
             # Exit the application
             print("Exiting application. Goodbye!")
             break
+        elif user == "7":
+            # Delete several tasks from the database at once
+            tm.delete_tasks()
 
 
 if __name__ == "__main__":
@@ -5,7 +5,112 @@ This module defines the Task class which represents a task object in the applica
 It provides methods for creating, retrieving, updating, and deleting tasks from the database.
 """
 
-from db import db, cursor
+import time
+from itertools import chain
+
+from db import get_conn
+
+# Upper bounds on each multi-row INSERT: a row count, and an estimated size
+# in bytes that stays under the 4 MiB max_allowed_packet default of older
+# MySQL servers even when descriptions are long TEXT values
+MAX_BATCH_SIZE = 1000
+MAX_BATCH_BYTES = 1024 * 1024
+
+# Allowance per row for the protocol and statement overhead around its values
+ROW_OVERHEAD_BYTES = 64
+
+# Number of rows read from the server per fetch when streaming get_all results
+FETCH_SIZE = 256
+
+# Task.get remembers up to GET_CACHE_SIZE found rows for GET_CACHE_TTL seconds,
+# which bounds how stale a task changed by another client can appear
+GET_CACHE_SIZE = 256
+GET_CACHE_TTL = 5.0
+
+# Rows returned by recent Task.get lookups as {task_id: (fetched_at, row)}
+_row_cache = {}
+
+# Maps database column names to the matching Task constructor arguments
+COLUMN_FIELDS = {
+    "id": "id",
+    "title": "title",
+    "description": "description",
+    "due_date": "due_date",
+    "priority_level": "priority",
+    "status": "status",
+    "created_at": "created_at",
+}
+
+# Task fields that may be changed after creation, mapped to their database columns
+UPDATABLE_COLUMNS = {
+    field: column for column, field in COLUMN_FIELDS.items() if field not in ("id", "created_at")
+}
+
+# Every task column, in schema order; used instead of SELECT * so that
+# statements do not depend on the table's physical column layout
+ALL_COLUMNS = ("id", "title", "description", "due_date", "priority_level", "status", "created_at")
+
+
+def select_list(columns):
+    """
+    Build a SELECT column list whose result keys match Task constructor arguments.
+    
+    Columns whose name differs from the Task argument are aliased
+    (e.g. ``priority_level AS priority``) so rows can be passed as ``Task(**row)``.
+    
+    :param columns: Database column names (keys of COLUMN_FIELDS)
+    :return: Comma-separated column list for a SELECT statement
+    """
+    return ", ".join(
+        column if COLUMN_FIELDS[column] == column else f"{column} AS {COLUMN_FIELDS[column]}"
+        for column in columns
+    )
+
+
+# Fixed SQL statements used by the Task methods. They are built once at import
+# and only their parameters are bound per call. Single-row statements are not
+# server-prepared: each call borrows a pooled connection, so a prepared handle
+# would be thrown away after one use and the PREPARE would add a round trip.
+# Repeated Task.get lookups are served from its row cache instead.
+_SQL_SELECT_ALL = f"SELECT {select_list(ALL_COLUMNS)} FROM tasks"
+_SQL_SELECT_BY_ID = f"{_SQL_SELECT_ALL} WHERE id = %s"
+_SQL_SELECT_BY_PREFIX = f"{_SQL_SELECT_ALL} WHERE id_prefix = %s ORDER BY id LIMIT 1"
+_SQL_INSERT = f"INSERT INTO tasks ({', '.join(ALL_COLUMNS)}) VALUES "
+_SQL_INSERT_ROW = "(%s, %s, %s, %s, %s, %s, %s)"
+_SQL_UPDATE_STATUS = "UPDATE tasks SET status = %s WHERE id = %s"
+_SQL_DELETE = "DELETE FROM tasks WHERE id = %s"
+
+def _insert_chunks(rows, batch_size):
+    """
+    Split INSERT parameter rows into chunks bounded by row count and size.
+    
+    A chunk is closed once it holds batch_size rows or adding the next row
+    would take its estimated size past MAX_BATCH_BYTES. A single row larger
+    than that limit is sent in a chunk of its own.
+    
+    :param rows: Iterable of parameter tuples, one per task
+    :param batch_size: Maximum number of rows per chunk
+    :return: Generator of lists of parameter tuples
+    """
+    chunk = []
+    chunk_bytes = 0
+    for row in rows:
+        # Estimate the row's size from the encoded text of its values
+        row_bytes = ROW_OVERHEAD_BYTES + sum(len(str(value).encode()) for value in row)
+        if chunk and (len(chunk) >= batch_size or chunk_bytes + row_bytes > MAX_BATCH_BYTES):
+            yield chunk
+            chunk = []
+            chunk_bytes = 0
+        chunk.append(row)
+        chunk_bytes += row_bytes
+    if chunk:
+        yield chunk
+
+
+# Allowed values for the priority and status fields
+VALID_PRIORITIES = ["Low", "Medium", "High"]
+VALID_STATUSES = ["Pending", "In Progress", "Completed"]
+
 
 
 class Task():
@@ -21,6 +126,18 @@ class Task():
         __status (str): Current status (Pending, In Progress, Completed)
         __created_at (str): Timestamp when the task was created
     """
+    # Fixed attribute layout (name-mangled private attributes) instead of a
+    # per-instance __dict__
+    __slots__ = (
+        "_Task__id",
+        "_Task__title",
+        "_Task__description",
+        "_Task__due_date",
+        "_Task__priority",
+        "_Task__status",
+        "_Task__created_at",
+    )
+    
     def __init__(self, id, title, description, due_date, priority, status, created_at):
         """
         Initialize a Task object with the provided parameters.
@@ -41,6 +158,28 @@ class Task():
         self.__status = status
         self.__created_at = created_at
     
+    @classmethod
+    def _from_row(cls, row):
+        """
+        Build a Task directly from a database row.
+        
+        Skips __init__ and fills the slots straight from the row, since data
+        read from the database needs no further processing. Fields missing from
+        the row (not selected) are set to None.
+        
+        :param row: Dictionary row keyed by Task field names
+        :return: Task object
+        """
+        task = cls.__new__(cls)
+        task.__id = row.get("id")
+        task.__title = row.get("title")
+        task.__description = row.get("description")
+        task.__due_date = row.get("due_date")
+        task.__priority = row.get("priority")
+        task.__status = row.get("status")
+        task.__created_at = row.get("created_at")
+        return task
+    
     # ==================== Property Getters ====================
     
     @property
@@ -104,17 +243,15 @@ class Task():
     @priority.setter
     def priority(self, value):
         """Set the task priority level."""
-        valid_priorities = ["Low", "Medium", "High"]
-        if value not in valid_priorities:
-            raise ValueError(f"Priority must be one of: {', '.join(valid_priorities)}")
+        if value not in VALID_PRIORITIES:
+            raise ValueError(f"Priority must be one of: {', '.join(VALID_PRIORITIES)}")
         self.__priority = value
     
     @status.setter
     def status(self, value):
         """Set the task status."""
-        valid_statuses = ["Pending", "In Progress", "Completed"]
-        if value not in valid_statuses:
-            raise ValueError(f"Status must be one of: {', '.join(valid_statuses)}")
+        if value not in VALID_STATUSES:
+            raise ValueError(f"Status must be one of: {', '.join(VALID_STATUSES)}")
         self.__status = value
     
     @staticmethod
@@ -122,38 +259,67 @@ class Task():
         """
         Retrieve a task from the database by ID.
         
-        Uses LIKE matching to allow partial UUID matching (first 8 characters).
-        This provides a more user-friendly way to specify tasks.
+        Matches the full UUID exactly, or, when exactly 8 characters are given,
+        the first 8 characters of the ID (stored in the indexed id_prefix
+        column). This provides a more user-friendly way to specify tasks.
+        
+        Found rows are cached for GET_CACHE_TTL seconds; the cache is cleared
+        whenever a task is saved, updated, or deleted.
         
-        :param task_id: The ID or partial ID of the task to retrieve
+        :param task_id: The full ID or 8-character ID prefix of the task to retrieve
         :return: Task object if found, None otherwise
         :raises: Catches and logs any database errors
         """
         try:
-            # Query using LIKE for partial UUID matching
-            cursor.execute("SELECT * FROM tasks WHERE id LIKE %s", (task_id + '%',))
-            result = cursor.fetchone()
-            
-            if result:
-                # Construct and return Task object from database result
-                return Task(
-                    id=result[0],
-                    title=result[1],
-                    description=result[2],
-                    due_date=result[3],
-                    priority=result[4],
-                    status=result[5],
-                    created_at=result[6]
-                )
-            return None
+            return Task._get_cached(task_id)
         except Exception as e:
             print(f"Error retrieving task: {e}")
             return None
     
     @staticmethod
-    def get_all(sort_by=None):
+    def _get_cached(task_id):
         """
-        Retrieve all tasks from the database with optional sorting.
+        Query the database for a task by ID or ID prefix, reusing recent rows.
+        
+        Only found rows are cached, so a task created by another client shows
+        up on the next lookup. Every call builds a new Task from the cached
+        row, so callers that modify the returned object do not affect later
+        lookups. Database errors propagate to the caller so that failed
+        lookups are not cached.
+        
+        :param task_id: The full ID or 8-character ID prefix of the task to retrieve
+        :return: Task object if found, None otherwise
+        """
+        now = time.monotonic()
+        cached = _row_cache.get(task_id)
+        if cached and now - cached[0] < GET_CACHE_TTL:
+            return Task._from_row(cached[1])
+        
+        with get_conn() as conn, conn.cursor(dictionary=True) as cursor:
+            # Exact match on the indexed 8-character prefix, or on the full ID
+            if len(task_id) == 8:
+                cursor.execute(_SQL_SELECT_BY_PREFIX, (task_id,))
+            else:
+                cursor.execute(_SQL_SELECT_BY_ID, (task_id,))
+            result = cursor.fetchone()
+        
+        # Drop any expired entry so the fresh row is stored as the newest
+        _row_cache.pop(task_id, None)
+        if not result:
+            return None
+        
+        # Evict the oldest entry once the cache is full
+        if len(_row_cache) >= GET_CACHE_SIZE:
+            del _row_cache[next(iter(_row_cache))]
+        _row_cache[task_id] = (now, result)
+        
+        # Construct and return Task object from database result
+        return Task._from_row(result)
+    
+    @staticmethod
+    def get_all(sort_by=None, limit=50, offset=0):
+        """
+        Retrieve a page of tasks from the database with optional sorting.
         
         Supports sorting by:
         - due_date: Ascending order (earliest first)
@@ -161,167 +327,416 @@ class Task():
         - status: Pending to Completed (Pending > In Progress > Completed)
         - None: Default database order
         
+        This is a generator: rows are streamed from the server and turned into
+        Task objects one at a time. Wrap the call in list() when a list is needed,
+        and consume it fully so the connection is released.
+        
         :param sort_by: Optional sorting criteria ('due_date', 'priority', 'status')
-        :return: List of Task objects sorted according to criteria
+        :param limit: Maximum number of tasks to return (None for no limit)
+        :param offset: Number of tasks to skip before the returned page
+        :return: Generator of Task objects sorted according to criteria
         :raises: Catches and logs any database errors
         """
+        # Build ORDER BY clause based on sort criteria. Ties are broken by
+        # due date and ID so that LIMIT/OFFSET pages are stable.
+        if sort_by == "due_date":
+            # Sort by due date in ascending order
+            order_by = " ORDER BY due_date ASC, id"
+        elif sort_by == "priority":
+            # Sort by priority level (High > Medium > Low, the ENUM order)
+            order_by = " ORDER BY priority_level, due_date, id"
+        elif sort_by == "status":
+            # Sort by status (Pending > In Progress > Completed, the ENUM order)
+            order_by = " ORDER BY status, due_date, id"
+        else:
+            # Default: primary key order
+            order_by = " ORDER BY id"
+        
+        sql = _SQL_SELECT_ALL + order_by
+        params = ()
+        
+        # Restrict the result to the requested page
+        if limit is not None:
+            sql += " LIMIT %s OFFSET %s"
+            params = (limit, offset)
+        
         try:
-            # Execute query based on sort criteria
-            if sort_by == "due_date":
-                # Sort by due date in ascending order
-                cursor.execute("SELECT * FROM tasks ORDER BY due_date ASC")
-            elif sort_by == "priority":
-                # Sort by priority level (High > Medium > Low)
-                cursor.execute("""
-                    SELECT * FROM tasks 
-                    ORDER BY CASE priority_level 
-                        WHEN 'High' THEN 1 
-                        WHEN 'Medium' THEN 2 
-                        WHEN 'Low' THEN 3 
-                        ELSE 4 
-                    END
-                """)
-            elif sort_by == "status":
-                # Sort by status (Pending > In Progress > Completed)
-                cursor.execute("""
-                    SELECT * FROM tasks 
-                    ORDER BY CASE status 
-                        WHEN 'Pending' THEN 1 
-                        WHEN 'In Progress' THEN 2 
-                        WHEN 'Completed' THEN 3 
-                        ELSE 4 
-                    END
-                """)
-            else:
-                # Default: no sorting
-                cursor.execute("SELECT * FROM tasks")
-            
-            # Fetch all results and convert to Task objects
-            results = cursor.fetchall()
-            tasks = []
-            
-            for result in results:
-                tasks.append(Task(
-                    id=result[0],
-                    title=result[1],
-                    description=result[2],
-                    due_date=result[3],
-                    priority=result[4],
-                    status=result[5],
-                    created_at=result[6]
-                ))
-            
-            return tasks
+            # An unbuffered cursor streams rows from the server as they are read
+            with get_conn() as conn, conn.cursor(dictionary=True, buffered=False) as cursor:
+                cursor.execute(sql, params)
+                # Read rows in batches and yield Task objects one at a time
+                while rows := cursor.fetchmany(FETCH_SIZE):
+                    for row in rows:
+                        yield Task._from_row(row)
         except Exception as e:
             print(f"Error retrieving tasks: {e}")
-            return []
     
-    def save(self):
+    def save(self, commit=True):
         """
         Save the current task to the database (insert new task).
         
         Inserts all task attributes into the database and commits the transaction.
         
+        :param commit: Commit immediately (pass False inside a UnitOfWork)
         :return: True if successful, False otherwise
         :raises: Catches and logs any database errors
         """
+        return Task.save_many([self], commit=commit)
+    
+    @classmethod
+    def save_many(cls, tasks, batch_size=500, commit=True):
+        """
+        Save several new tasks to the database in a single transaction.
+        
+        Tasks are inserted in chunks using multi-row INSERT statements, and the
+        transaction is committed once after all chunks have been written. Each
+        chunk holds at most batch_size rows and about MAX_BATCH_BYTES of data.
+        A server-prepared cursor is used only when several full chunks share
+        the same statement.
+        
+        :param tasks: List of Task objects to insert
+        :param batch_size: Maximum number of rows per INSERT (capped at MAX_BATCH_SIZE)
+        :param commit: Commit immediately (pass False inside a UnitOfWork)
+        :return: True if successful, False otherwise
+        :raises: Catches and logs any database errors
+        """
+        if not tasks:
+            return True
+        
+        # Cap the number of rows per statement
+        batch_size = max(1, min(batch_size, MAX_BATCH_SIZE))
+        
+        # Every full chunk shares the same statement, so it is built only once
+        full_chunk_sql = _SQL_INSERT + ", ".join([_SQL_INSERT_ROW] * batch_size)
+        
+        # Read the private attributes directly rather than through properties
+        rows = (
+            (task.__id, task.__title, task.__description, task.__due_date,
+             task.__priority, task.__status, task.__created_at)
+            for task in tasks
+        )
+        # Keep each statement below the server's packet size limit
+        chunks = list(_insert_chunks(rows, batch_size))
+        
+        # Server-side preparing only pays off when the full-chunk INSERT is
+        # executed more than once; a one-off statement would just add the
+        # PREPARE round trip on a freshly borrowed connection
+        prepared = sum(len(chunk) == batch_size for chunk in chunks) > 1
+        
         try:
-            # Insert task data into database
-            cursor.execute(
-                """INSERT INTO tasks VALUES(%s, %s, %s, %s, %s, %s, %s)""",
-                (self.id, self.title, self.description, self.due_date, 
-                 self.priority, self.status, self.created_at)
-            )
-            # Commit the transaction to save changes
-            db.commit()
+            with get_conn() as conn, conn.cursor(prepared=prepared) as cursor:
+                for chunk in chunks:
+                    # One placeholder group per task in the chunk
+                    if len(chunk) == batch_size:
+                        sql = full_chunk_sql
+                    else:
+                        sql = _SQL_INSERT + ", ".join([_SQL_INSERT_ROW] * len(chunk))
+                    cursor.execute(sql, list(chain.from_iterable(chunk)))
+                # Commit all inserted rows at once
+                if commit:
+                    conn.commit()
+            # Cached lookups may now be stale
+            _row_cache.clear()
             return True
         except Exception as e:
-            print(f"Error saving task: {e}")
+            print(f"Error saving tasks: {e}")
             return False
     
-    def update_details(self, title=None, description=None, due_date=None, priority=None):
+    def update_details(self, title=None, description=None, due_date=None, priority=None, commit=True):
         """
         Update task details including title, description, due date, and priority.
         
         Only updates fields that are provided (not None). Updates both the instance
-        attributes and the database record.
+        attributes and the database record, using a single UPDATE statement for
+        all provided fields (see update_fields).
         
         :param title: New title for the task (optional)
         :param description: New description for the task (optional)
         :param due_date: New due date for the task in YYYY-MM-DD format (optional)
         :param priority: New priority level for the task (optional)
+        :param commit: Commit immediately (pass False inside a UnitOfWork)
+        :return: True if successful, False otherwise
+        :raises: Catches and logs any database errors
+        """
+        fields = {
+            name: value
+            for name, value in (("title", title), ("description", description),
+                                ("due_date", due_date), ("priority", priority))
+            if value is not None
+        }
+        return self.update_fields(commit=commit, **fields)
+    
+    def update_fields(self, commit=True, **fields):
+        """
+        Update any combination of task fields with a single UPDATE statement.
+        
+        Every value is validated through the property setters of a scratch
+        instance before the database is touched. The instance attributes are
+        only changed once the UPDATE has succeeded, so a rejected value or a
+        database error leaves the task as it was.
+        
+        :param commit: Commit immediately (pass False inside a UnitOfWork)
+        :param fields: New values keyed by Task field name
+                       (title, description, due_date, priority, status)
         :return: True if successful, False otherwise
         :raises: Catches and logs any database errors
         """
         try:
-            # Update title if provided
-            if title is not None:
-                self.title = title
-                cursor.execute("UPDATE tasks SET title = %s WHERE id = %s", (title, self.id))
-            
-            # Update description if provided
-            if description is not None:
-                self.description = description
-                cursor.execute("UPDATE tasks SET description = %s WHERE id = %s", (description, self.id))
+            # Run every value through the property setters for validation
+            scratch = Task._from_row({})
+            for field, value in fields.items():
+                if field not in UPDATABLE_COLUMNS:
+                    raise ValueError(f"Cannot update task field: {field}")
+                setattr(scratch, field, value)
             
-            # Update due date if provided
-            if due_date is not None:
-                self.due_date = due_date
-                cursor.execute("UPDATE tasks SET due_date = %s WHERE id = %s", (due_date, self.id))
+            # Nothing to update
+            if not fields:
+                return True
             
-            # Update priority if provided
-            if priority is not None:
-                self.priority = priority
-                cursor.execute("UPDATE tasks SET priority_level = %s WHERE id = %s", (priority, self.id))
-            
-            # Commit the transaction to save all changes
-            db.commit()
+            with get_conn() as conn, conn.cursor() as cursor:
+                # Apply all changes with a single UPDATE statement
+                cursor.execute(
+                    f"UPDATE tasks SET {', '.join(f'{UPDATABLE_COLUMNS[field]} = %s' for field in fields)} WHERE id = %s",
+                    [*fields.values(), self.__id]
+                )
+                
+                # Commit the transaction to save all changes
+                if commit:
+                    conn.commit()
+            # Apply the saved values to the instance
+            for field, value in fields.items():
+                setattr(self, field, value)
+            # Cached lookups may now be stale
+            _row_cache.clear()
             return True
         except Exception as e:
             print(f"Error updating task: {e}")
             return False
     
-    def update_status(self, status):
+    def update_status(self, status, commit=True):
         """
         Update the status of the task.
         
         Updates the task status in both the instance and the database.
         
         :param status: New status - must be one of: 'Pending', 'In Progress', 'Completed'
+        :param commit: Commit immediately (pass False inside a UnitOfWork)
         :return: True if successful, False otherwise
         :raises: Catches and logs any database errors
         """
         try:
-            # Update instance status using the setter (which validates)
-            self.status = status
-            # Update database record
-            cursor.execute("UPDATE tasks SET status = %s WHERE id = %s", (status, self.__id))
-            # Commit the transaction
-            db.commit()
+            # Validate the status before touching the database
+            if status not in VALID_STATUSES:
+                raise ValueError(f"Status must be one of: {', '.join(VALID_STATUSES)}")
+            with get_conn() as conn, conn.cursor() as cursor:
+                # Update database record
+                cursor.execute(_SQL_UPDATE_STATUS, (status, self.__id))
+                # Commit the transaction
+                if commit:
+                    conn.commit()
+            # Update instance status once the database has accepted it
+            self.__status = status
+            # Cached lookups may now be stale
+            _row_cache.clear()
             return True
         except Exception as e:
             print(f"Error updating status: {e}")
             return False
     
-    def delete(self):
+    @classmethod
+    def update_by_id(cls, task_id, commit=True, **fields):
+        """
+        Update a task's fields by ID without loading it first.
+        
+        Issues a single UPDATE matching the exact full ID, so callers that
+        already know the ID skip the SELECT round-trip (see resolve_ids for
+        turning ID prefixes into full IDs first). A task
+        whose fields already hold the new values still counts as updated,
+        since the pool reports matched rather than changed rows.
+        
+        :param task_id: The full ID of the task to update
+        :param commit: Commit immediately (pass False inside a UnitOfWork)
+        :param fields: New values keyed by Task field name
+                       (title, description, due_date, priority, status)
+        :return: True if a task matched the ID, False otherwise
+        :raises: Catches and logs any database errors
+        """
+        try:
+            # Run every value through the property setters for validation
+            scratch = cls._from_row({})
+            for field, value in fields.items():
+                if field not in UPDATABLE_COLUMNS:
+                    raise ValueError(f"Cannot update task field: {field}")
+                setattr(scratch, field, value)
+            
+            if not fields:
+                return True
+            
+            with get_conn() as conn, conn.cursor() as cursor:
+                cursor.execute(
+                    f"UPDATE tasks SET {', '.join(f'{UPDATABLE_COLUMNS[field]} = %s' for field in fields)} "
+                    "WHERE id = %s",
+                    [*fields.values(), task_id]
+                )
+                updated = cursor.rowcount > 0
+                # Commit the transaction to save all changes
+                if commit:
+                    conn.commit()
+            # Cached lookups may now be stale
+            _row_cache.clear()
+            return updated
+        except Exception as e:
+            print(f"Error updating task: {e}")
+            return False
+    
+    @staticmethod
+    def resolve_ids(task_ids):
+        """
+        Map task IDs or 8-character ID prefixes to the full IDs of existing tasks.
+        
+        Each ID is matched like Task.get does: exactly on the full ID, or on
+        the id_prefix column when it is exactly 8 characters long (an exact
+        full-ID match wins). All of them
+        are looked up with a single query. IDs that match no task are left out
+        of the result, and prefixes shared by several tasks map to None.
+        
+        :param task_ids: Iterable of full task IDs or 8-character ID prefixes
+        :return: Dictionary mapping each matched ID to the full task ID (None
+                 for an ambiguous prefix), or None if the lookup failed
+        :raises: Catches and logs any database errors
+        """
+        task_ids = set(task_ids)
+        if not task_ids:
+            return {}
+        
+        try:
+            # Only inputs of exactly 8 characters are treated as prefixes
+            prefixes = [task_id for task_id in task_ids if len(task_id) == 8]
+            sql = f"SELECT id, id_prefix FROM tasks WHERE id IN ({', '.join(['%s'] * len(task_ids))})"
+            if prefixes:
+                sql += f" OR id_prefix IN ({', '.join(['%s'] * len(prefixes))})"
+            
+            with get_conn() as conn, conn.cursor() as cursor:
+                # Look up every full ID and prefix at once
+                cursor.execute(sql, [*task_ids, *prefixes])
+                rows = cursor.fetchall()
+            
+            full_ids = {task_id for task_id, _ in rows}
+            by_prefix = {}
+            for task_id, prefix in rows:
+                by_prefix.setdefault(prefix, set()).add(task_id)
+            
+            # Prefer an exact match on the full ID over a prefix match
+            resolved = {}
+            for task_id in task_ids:
+                if task_id in full_ids:
+                    resolved[task_id] = task_id
+                elif task_id in by_prefix:
+                    matches = by_prefix[task_id]
+                    resolved[task_id] = next(iter(matches)) if len(matches) == 1 else None
+            return resolved
+        except Exception as e:
+            print(f"Error resolving task IDs: {e}")
+            return None
+    
+    @classmethod
+    def update_status_many(cls, id_status_pairs, commit=True):
+        """
+        Update the status of several tasks with a single UPDATE statement.
+        
+        Builds one ``UPDATE ... SET status = CASE id WHEN ... END`` statement
+        covering every task and commits it once. Task instances are not
+        modified; callers holding Task objects should update them afterwards.
+        
+        :param id_status_pairs: Iterable of (task_id, status) tuples
+        :param commit: Commit immediately (pass False inside a UnitOfWork)
+        :return: True if successful, False otherwise
+        :raises: Catches and logs any database errors
+        """
+        try:
+            # Later pairs for the same ID take precedence
+            updates = dict(id_status_pairs)
+            if not updates:
+                return True
+            
+            # Validate every status before touching the database
+            for status in updates.values():
+                if status not in VALID_STATUSES:
+                    raise ValueError(f"Status must be one of: {', '.join(VALID_STATUSES)}")
+            
+            cases = " ".join(["WHEN %s THEN %s"] * len(updates))
+            placeholders = ", ".join(["%s"] * len(updates))
+            params = [*chain.from_iterable(updates.items()), *updates.keys()]
+            
+            with get_conn() as conn, conn.cursor() as cursor:
+                cursor.execute(
+                    f"UPDATE tasks SET status = CASE id {cases} END WHERE id IN ({placeholders})",
+                    params
+                )
+                # Commit all status changes at once
+                if commit:
+                    conn.commit()
+            # Cached lookups may now be stale
+            _row_cache.clear()
+            return True
+        except Exception as e:
+            print(f"Error updating statuses: {e}")
+            return False
+    
+    def delete(self, commit=True):
         """
         Delete the task from the database.
         
         Permanently removes this task from the database.
         
+        :param commit: Commit immediately (pass False inside a UnitOfWork)
         :return: True if successful, False otherwise
         :raises: Catches and logs any database errors
         """
         try:
-            # Delete the task record from the database
-            cursor.execute("DELETE FROM tasks WHERE id = %s", (self.__id,))
-            # Commit the transaction to apply the deletion
-            db.commit()
+            with get_conn() as conn, conn.cursor() as cursor:
+                # Delete the task record from the database
+                cursor.execute(_SQL_DELETE, (self.__id,))
+                # Commit the transaction to apply the deletion
+                if commit:
+                    conn.commit()
+            # Cached lookups may now be stale
+            _row_cache.clear()
             return True
         except Exception as e:
             print(f"Error deleting task: {e}")
             return False
     
+    @classmethod
+    def delete_many(cls, task_ids, commit=True):
+        """
+        Delete several tasks from the database in a single transaction.
+        
+        :param task_ids: Iterable of full task IDs to delete
+        :param commit: Commit immediately (pass False inside a UnitOfWork)
+        :return: True if successful, False otherwise
+        :raises: Catches and logs any database errors
+        """
+        task_ids = list(task_ids)
+        if not task_ids:
+            return True
+        
+        try:
+            placeholders = ", ".join(["%s"] * len(task_ids))
+            
+            with get_conn() as conn, conn.cursor() as cursor:
+                # Delete every task record with a single statement
+                cursor.execute(f"DELETE FROM tasks WHERE id IN ({placeholders})", task_ids)
+                # Commit all deletions at once
+                if commit:
+                    conn.commit()
+            # Cached lookups may now be stale
+            _row_cache.clear()
+            return True
+        except Exception as e:
+            print(f"Error deleting tasks: {e}")
+            return False
+    
     def __str__(self):
         """
         String representation of the task for printing.
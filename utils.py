@@ -6,13 +6,25 @@ including creation, retrieval, updating, and deletion of tasks.
 """
 
 from uuid import uuid4
+import sys
 import time
 import datetime
-from db import cursor, db
 from models.task import Task
 
-# Current timestamp for task creation tracking
-ts = time.time()
+# Number of tasks fetched and displayed per page in list_tasks
+PAGE_SIZE = 50
+
+# Seconds a fetched listing page may be reused by a follow-up operation
+LISTING_TTL = 2.0
+
+# Seconds the tasks shown by list_tasks may be reused to resolve an ID typed
+# after reading the table; any write through the TaskManager discards them sooner
+LAST_LISTING_TTL = 300.0
+
+# Task table layout used by list_tasks, built once at import
+_ROW_FORMAT = "{:<38} {:<20} {:<25} {:<12} {:<10} {:<15} {:<20}".format
+_HEADER = _ROW_FORMAT("ID", "TITLE", "DESCRIPTION", "DUE DATE", "PRIORITY", "STATUS", "CREATED AT")
+_BAR = "=" * 120
 
 
 class TaskManager():
@@ -26,11 +38,16 @@ class TaskManager():
         """
         Initialize the TaskManager.
         
-        No parameters are required as the TaskManager uses the global
-        database connection established in db.py
+        No parameters are required as the TaskManager relies on the Task
+        model, which borrows connections from the pool defined in db.py
         """
         # Private attribute to track if manager is initialized
         self.__initialized = True
+        # Tasks shown by the last list_tasks call as (listed_at, tasks), with the
+        # tasks keyed by full ID and 8-char prefix
+        self.__last_listing = (0.0, {})
+        # Last fetched listing page as ((sort_by, offset), fetched_at, tasks)
+        self.__tasks_cache = (None, 0.0, None)
     
     # ==================== Property Getters ====================
     
@@ -39,22 +56,124 @@ class TaskManager():
         """Check if the TaskManager is properly initialized."""
         return self.__initialized
     
+    # ==================== Private Helpers ====================
+    
+    def __find_task(self, task_id):
+        """
+        Look up a task by ID, preferring the tasks from the last listing.
+        
+        Falls back to a database query when the ID is not in the last listing
+        or the listing finished more than LAST_LISTING_TTL seconds ago.
+        
+        :param task_id: The ID or 8-character ID prefix of the task
+        :return: Task object if found, None otherwise
+        """
+        listed_at, listing = self.__last_listing
+        if time.monotonic() - listed_at < LAST_LISTING_TTL:
+            # The listing is keyed by full ID and 8-char prefix, so only exact keys match
+            task = listing.get(task_id)
+            if task:
+                return task
+        return Task.get(task_id)
+    
+    def __fetch_page(self, sort_by, offset):
+        """
+        Fetch one listing page, reusing the previous fetch if it is still fresh.
+        
+        Consecutive operations that list the same page within LISTING_TTL
+        seconds share a single query.
+        
+        :param sort_by: Sorting criteria passed to Task.get_all
+        :param offset: Number of tasks to skip before the page
+        :return: List of Task objects on the page
+        """
+        key = (sort_by, offset)
+        cached_key, fetched_at, cached_tasks = self.__tasks_cache
+        if cached_key == key and time.monotonic() - fetched_at < LISTING_TTL:
+            return cached_tasks
+        
+        tasks = list(Task.get_all(sort_by=sort_by, limit=PAGE_SIZE, offset=offset))
+        self.__tasks_cache = (key, time.monotonic(), tasks)
+        return tasks
+    
+    def __invalidate_listing(self):
+        """Discard the cached listing page and listed tasks after the tasks table changes."""
+        self.__tasks_cache = (None, 0.0, None)
+        self.__last_listing = (0.0, {})
+    
+    def __prompt_task_ids(self, prompt):
+        """
+        Ask the user for task ID(s), listing the tasks first only if needed.
+        
+        Users who already know the ID skip the task listing and its full-table query.
+        
+        :param prompt: Prompt shown when asking for the ID(s)
+        :return: The raw ID input entered by the user
+        """
+        if not enter_confirmation("\nDo you already know the task ID? (yes/no): "):
+            # Display all tasks to help user find the task ID
+            self.list_tasks()
+        return input(prompt)
+    
+    def __resolve_task(self, prompt):
+        """
+        Ask the user for a task ID and resolve it to a Task.
+        
+        :param prompt: Prompt shown when asking for the ID
+        :return: Task object if found, None otherwise
+        """
+        task_id = self.__prompt_task_ids(prompt).strip()
+        
+        # Resolve the task from the listing, or the database if needed
+        task = self.__find_task(task_id)
+        
+        if not task:
+            print("Task not found!")
+        return task
+    
+    def __resolve_tasks(self, prompt):
+        """
+        Ask the user for comma-separated task IDs and resolve each to a Task.
+        
+        IDs that refer to the same task, such as a repeated ID or a prefix
+        and the full ID, yield that task only once.
+        
+        :param prompt: Prompt shown when asking for the IDs
+        :return: List of Task objects if all were found, None otherwise
+        """
+        task_ids = self.__prompt_task_ids(prompt)
+        
+        # Resolve each task from the listing, or the database if needed,
+        # keeping one entry per full task ID
+        tasks = {}
+        for task_id in task_ids.split(","):
+            task_id = task_id.strip()
+            if not task_id:
+                continue
+            task = self.__find_task(task_id)
+            if not task:
+                print(f"Task '{task_id}' not found!")
+                return None
+            tasks.setdefault(task.id, task)
+        
+        if not tasks:
+            print("Task not found!")
+            return None
+        return list(tasks.values())
+    
     # ==================== Public Methods ====================
     
     def add_task(self):
         """Add a new task and return the Task object."""
         title = input("Enter the title: ")
         description = input("Enter a description: ")
-        month = enter_month()
-        day = enter_day(month)
-        year = enter_year()
+        due_date = enter_date()
         priority = enter_priority()
         status = enter_status()
         
-        # Generate unique task ID and format due date
+        # Generate unique task ID
         task_id = str(uuid4())
-        due_date = f"{year}-{month}-{day}"
-        timestamp = datetime.datetime.fromtimestamp(ts).strftime('%Y-%m-%d %H:%M:%S')
+        timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
         # Create Task object with provided details
         task = Task(
@@ -69,6 +188,7 @@ class TaskManager():
         
         # Save task to database and display confirmation
         if task.save():
+            self.__invalidate_listing()
             print("\nTask added successfully!")
             task.display()
             return task
@@ -77,7 +197,7 @@ class TaskManager():
             return None
     def list_tasks(self):
         """
-        Display all tasks from the database with optional sorting.
+        Display tasks from the database with optional sorting, one page at a time.
         
         Allows users to sort tasks by:
         - Due date (ascending)
@@ -85,6 +205,9 @@ class TaskManager():
         - Status (Pending -> In Progress -> Completed)
         - No sorting (default database order)
         
+        Tasks are fetched PAGE_SIZE at a time; the user is asked whether to
+        show the next page.
+        
         :return: List of Task objects displayed
         """
         print("\nHow would you like to sort the tasks?")
@@ -103,34 +226,61 @@ class TaskManager():
             "4": None
         }
         
-        # Retrieve tasks with the selected sorting method
-        tasks = Task.get_all(sort_by=sort_map.get(sort_choice))
-        
-        if not tasks:
-            print("\nNo tasks found.")
-            return []
+        sort_by = sort_map.get(sort_choice)
         
-        # Display formatted table header
-        print("\n" + "="*120)
-        print(f"{'ID':<38} {'TITLE':<20} {'DESCRIPTION':<25} {'DUE DATE':<12} {'PRIORITY':<10} {'STATUS':<15} {'CREATED AT':<20}")
-        print("="*120)
+        tasks = []
+        offset = 0
         
-        # Display each task in a formatted table row
-        for task in tasks:
-            # Truncate long values for better display
-            task_id = task.id[:8] + "..."  # Show first 8 characters of UUID
-            title = task.title[:20] if len(task.title) > 20 else task.title
-            description = task.description[:25] if len(task.description) > 25 else task.description
-            due_date = str(task.due_date)
-            priority = task.priority
-            status = task.status
-            created_at = str(task.created_at)
+        while True:
+            # Format the current page of tasks with the selected sorting method
+            page = self.__fetch_page(sort_by, offset)
+            rows = [
+                _ROW_FORMAT(
+                    task.id[:8] + "...",  # Show first 8 characters of UUID
+                    task.title[:20],
+                    task.description[:25],
+                    str(task.due_date),
+                    task.priority,
+                    task.status,
+                    str(task.created_at)
+                )
+                for task in page
+            ]
+            
+            if rows and not tasks:
+                # Display formatted table header before the first row
+                rows[:0] = ["\n" + _BAR, _HEADER, _BAR]
+            
+            # Write the whole page with a single call
+            if rows:
+                sys.stdout.write("\n".join(rows) + "\n")
+            
+            tasks.extend(page)
             
-            print(f"{task_id:<38} {title:<20} {description:<25} {due_date:<12} {priority:<10} {status:<15} {created_at:<20}")
+            if not tasks:
+                print("\nNo tasks found.")
+                self.__last_listing = (0.0, {})
+                return []
+            
+            # Stop when the last page has been shown or the user is done
+            if len(page) < PAGE_SIZE:
+                break
+            if not enter_confirmation("\nShow more tasks? (yes/no): "):
+                break
+            
+            # Move on to the next page
+            offset += PAGE_SIZE
         
-        # Display table footer with total count
-        print("="*120)
-        print(f"\nTotal tasks: {len(tasks)}\n")
+        # Display table footer with the number of tasks on the pages shown
+        print(_BAR)
+        print(f"\nTasks shown: {len(tasks)}\n")
+        
+        # Remember the listing so follow-up lookups can skip the database
+        listing = {}
+        for task in tasks:
+            listing[task.id] = task
+            listing[task.id[:8]] = task
+        self.__last_listing = (time.monotonic(), listing)
         
         return tasks
     
@@ -138,24 +288,19 @@ class TaskManager():
         """
         Update the details of an existing task.
         
-        Allows users to modify task properties including:
+        Allows users to modify one or more task properties at once, including:
         - Title
         - Description
         - Due Date
         - Priority
         - Status
         
+        All selected changes are saved with a single database update.
+        
         :return: Updated Task object if successful, None otherwise
         """
-        # Display all tasks to help user find the task ID
-        self.list_tasks()
-        task_id = input("\nEnter the task ID (you can use the first 8 characters): ")
-        
-        # Retrieve the task from database
-        task = Task.get(task_id)
-        
+        task = self.__resolve_task("\nEnter the task ID (you can use the first 8 characters): ")
         if not task:
-            print("Task not found!")
             return None
         
         print("\nCurrent task details:")
@@ -168,69 +313,54 @@ class TaskManager():
         print("4. Priority")
         print("5. Status")
         
-        choice = input("Enter your choice (1-5): ")
-        
-        # Update selected field
-        if choice == "1":
-            new_title = input("Enter new title: ")
-            if task.update_details(title=new_title):
-                print("Title updated successfully!")
-        elif choice == "2":
-            new_description = input("Enter new description: ")
-            if task.update_details(description=new_description):
-                print("Description updated successfully!")
-        elif choice == "3":
-            month = enter_month()
-            day = enter_day(month)
-            year = enter_year()
-            new_date = f"{year}-{month}-{day}"
-            if task.update_details(due_date=new_date):
-                print("Due date updated successfully!")
-        elif choice == "4":
-            new_priority = enter_priority()
-            if task.update_details(priority=new_priority):
-                print("Priority updated successfully!")
-        elif choice == "5":
-            new_status = enter_status()
-            if task.update_status(new_status):
-                print("Status updated successfully!")
-        else:
+        choices = input("Enter your choice(s) (1-5), separated by commas: ")
+        
+        # Check every selected choice before asking for any new value
+        selected = [choice.strip() for choice in choices.split(",") if choice.strip()]
+        if not selected or any(choice not in _UPDATE_FIELDS for choice in selected):
             print("Invalid choice!")
             return None
         
-        # Retrieve and display updated task
-        updated_task = Task.get(task.id)
-        if updated_task:
+        # Collect the new value of every selected field
+        changes = {}
+        for choice in selected:
+            field, read_value = _UPDATE_FIELDS[choice]
+            changes[field] = read_value()
+        
+        # Apply all changes with one update; this also updates the local task object
+        if task.update_fields(**changes):
+            self.__invalidate_listing()
+            print("Task updated successfully!")
+            # Display the updated task without reloading it
             print("\nUpdated task details:")
-            updated_task.display()
-            return updated_task
+            task.display()
+            return task
         
         return None
     
     def mark_completed(self):
         """
-        Mark a task as completed in the database.
+        Mark one or more tasks as completed in the database.
         
-        Updates the task status to 'Completed' and displays the updated task.
+        Accepts a comma-separated list of task IDs, updates all of their statuses
+        to 'Completed' with a single batched update, and displays the updated tasks.
         
-        :return: Updated Task object if successful, None otherwise
+        :return: List of updated Task objects if successful, None otherwise
         """
-        # Display all tasks for user reference
-        self.list_tasks()
-        task_id = input("\nEnter the task ID to mark as completed (you can use the first 8 characters): ")
-        
-        # Retrieve the task from database
-        task = Task.get(task_id)
-        
-        if not task:
-            print("Task not found!")
+        tasks = self.__resolve_tasks(
+            "\nEnter the task ID(s) to mark as completed, separated by commas (you can use the first 8 characters): "
+        )
+        if not tasks:
             return None
         
-        # Update task status to Completed and display result
-        if task.update_status("Completed"):
-            print(f"\nTask '{task.title}' marked as completed!")
-            task.display()
-            return task
+        # Update all task statuses to Completed at once and display result
+        if Task.update_status_many([(task.id, "Completed") for task in tasks]):
+            self.__invalidate_listing()
+            for task in tasks:
+                task.status = "Completed"
+                print(f"\nTask '{task.title}' marked as completed!")
+                task.display()
+            return tasks
         else:
             print("Failed to mark task as completed.")
             return None
@@ -244,37 +374,60 @@ class TaskManager():
             
             :return: True if deletion successful, False otherwise
         """
-        # Display all tasks for user reference
-        self.list_tasks()
-        task_id = input("\nEnter the task ID to delete (you can use the first 8 characters): ")
-        
-        # Retrieve the task from database
-        task = Task.get(task_id)
-        
+        task = self.__resolve_task("\nEnter the task ID to delete (you can use the first 8 characters): ")
         if not task:
-            print("Task not found!")
             return False
         
         # Display task details before deletion
         task.display()
         
         # Force user to answer 'yes' or 'no'
-        while True:
-            confirm = input(f"\nAre you sure you want to delete this task? (yes/no): ").lower().strip()
-            
-            if confirm == "yes":
-                # Delete task if user confirms
-                if task.delete():
-                    print(f"\nTask '{task.title}' deleted successfully!")
-                    return True
-                else:
-                    print("Failed to delete task.")
-                    return False
-            elif confirm == "no":
-                print("Deletion cancelled.")
-                return False
-            else:
-                print("Invalid input! Please enter 'yes' or 'no'.")
+        if not enter_confirmation("\nAre you sure you want to delete this task? (yes/no): "):
+            print("Deletion cancelled.")
+            return False
+        
+        # Delete task if user confirms
+        if task.delete():
+            self.__invalidate_listing()
+            print(f"\nTask '{task.title}' deleted successfully!")
+            return True
+        else:
+            print("Failed to delete task.")
+            return False
+    
+    def delete_tasks(self):
+        """
+        Delete several tasks from the database with a single confirmation.
+        
+        Accepts a comma-separated list of task IDs, displays every matching task,
+        and asks once for confirmation before deleting them all with a single
+        batched statement. Forces user to respond with 'yes' or 'no'.
+        
+        :return: True if deletion successful, False otherwise
+        """
+        tasks = self.__resolve_tasks(
+            "\nEnter the task IDs to delete, separated by commas (you can use the first 8 characters): "
+        )
+        if not tasks:
+            return False
+        
+        # Display task details before deletion
+        for task in tasks:
+            task.display()
+        
+        # Force user to answer 'yes' or 'no'
+        if not enter_confirmation(f"\nAre you sure you want to delete these {len(tasks)} tasks? (yes/no): "):
+            print("Deletion cancelled.")
+            return False
+        
+        # Delete all tasks at once if user confirms
+        if Task.delete_many([task.id for task in tasks]):
+            self.__invalidate_listing()
+            print(f"\n{len(tasks)} tasks deleted successfully!")
+            return True
+        else:
+            print("Failed to delete tasks.")
+            return False
 
 
 # ==================== Private Utility Functions ====================
@@ -282,85 +435,54 @@ class TaskManager():
 # While not strictly private (Python doesn't enforce it), they are intended
 # for internal use by the TaskManager class.
 
-def enter_month():
-    """
-    Prompt user to enter a month number and validate input.
-    
-    Displays a numbered list of months and ensures the user selects
-    a valid month (1-12).
-    
-    :return: Month number as a string ("1" through "12")
-    """
-    # Valid month numbers
-    numbered_dates = ["1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11", "12"]
-    
-    while True:
-        print("Enter the month by its number")
-        print("1 - January")
-        print("2 - February")
-        print("3 - March")
-        print("4 - April")
-        print("5 - May")
-        print("6 - June")
-        print("7 - July")
-        print("8 - August")
-        print("9 - September")
-        print("10 - October")
-        print("11 - November")
-        print("12 - December")
-        try:
-            user = input()
-            if user not in numbered_dates:
-                raise ValueError("Invalid month number")
-            else:
-                return user
-        except ValueError:
-            print("Invalid input. Please try again.")
+# Menus shown by the input helpers, built once at import
+_PRIORITY_MENU = "1. Low\n2. Medium\n3. High\n"
+_STATUS_MENU = "1. Pending\n2. In Progress\n3. Completed\n"
+
+# Menu numbers mapped to the priority and status values they select
+_PRIORITY_MAP = {"1": "Low", "2": "Medium", "3": "High"}
+_STATUS_MAP = {"1": "Pending", "2": "In Progress", "3": "Completed"}
+
+# Accepted confirmation answers mapped to the decision they stand for
+_CONFIRM = {"yes": True, "y": True, "no": False, "n": False}
 
 
-def enter_day(month):
+def _read(prompt):
     """
-    Prompt user to enter a day number and validate based on the month.
+    Prompt for and read one line from standard input.
     
-    Ensures the user enters a valid day for the given month,
-    accounting for the number of days in each month.
+    A lighter-weight stand-in for input() in the validation retry loops:
+    reads straight from sys.stdin without readline/history handling.
     
-    :param month: Month number as a string ("1" through "12")
-    :return: Day number as a string ("1" through max days in month)
+    :param prompt: Text written before reading
+    :return: The line entered, without its trailing newline
+    :raises EOFError: If standard input is exhausted, matching input()
     """
-    # Days in each month (non-leap year)
-    days_in_month = {
-        "1": 31, "2": 28, "3": 31, "4": 30, "5": 31, "6": 30,
-        "7": 31, "8": 31, "9": 30, "10": 31, "11": 30, "12": 31
-    }
-    max_day = int(days_in_month[month])
-    
-    while True:
-        user = input(f"Enter the day between 1-{max_day}: ")
-        try:
-            if int(user) < 1 or int(user) > max_day:
-                raise ValueError(f"Day must be between 1-{max_day}")
-            else:
-                return user
-        except ValueError:
-            print("Invalid input. Please try again.")
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
 
-def enter_year():
+
+def enter_date():
     """
-    Prompt user to enter a year and validate it's 2026 or later.
+    Prompt user to enter a due date and validate it.
     
-    Ensures the entered year is at least 2026 (the current year).
+    Accepts a single YYYY-MM-DD date, so month lengths and leap years are
+    checked by datetime, and ensures the year is 2026 or later.
     
-    :return: Year as a string
+    :return: Due date as a string in YYYY-MM-DD format
     """
     while True:
-        year = input("Enter a year: ")
         try:
-            if int(year) < 2026:
-                raise ValueError("Year must be 2026 onwards")
-            return year
+            date = datetime.date.fromisoformat(_read("Enter the due date (YYYY-MM-DD): ").strip())
+            if date.year >= 2026:
+                return date.isoformat()
         except ValueError:
-            print("Invalid input. Please enter a valid year (2026 or later).")
+            pass
+        print("Invalid date. Please use YYYY-MM-DD with a year of 2026 or later.")
 
 def enter_priority():
     """
@@ -370,23 +492,15 @@ def enter_priority():
     
     :return: Priority level as a string ("Low", "Medium", or "High")
     """
-    # Define priority options
-    priorities = ["1. Low", "2. Medium", "3. High"]
-    priorities_num = ["1", "2", "3"]
-    priorities_dict = {"1": "Low", "2": "Medium", "3": "High"}
-    
     # Display priority options
-    for priority in priorities:
-        print(priority)
+    sys.stdout.write(_PRIORITY_MENU)
     
     while True:
-        user = input("Enter the priority by its number: ")
-        try:
-            if user not in priorities_num:
-                raise ValueError("Must be 1, 2, or 3")
-            return priorities_dict[user]
-        except ValueError:
-            print("Invalid input. Please enter 1, 2, or 3.")
+        # Validate and translate the choice in one lookup
+        priority = _PRIORITY_MAP.get(_read("Enter the priority by its number: "))
+        if priority is not None:
+            return priority
+        print("Invalid input. Please enter 1, 2, or 3.")
 
 def enter_status():
     """
@@ -396,20 +510,38 @@ def enter_status():
     
     :return: Status as a string ("Pending", "In Progress", or "Completed")
     """
-    # Define status options
-    statuses = ["1. Pending", "2. In Progress", "3. Completed"]
-    statuses_num = ["1", "2", "3"]
-    status_dict = {"1": "Pending", "2": "In Progress", "3": "Completed"}
-    
     # Display status options
-    for status in statuses:
-        print(status)
+    sys.stdout.write(_STATUS_MENU)
     
     while True:
-        user = input("Enter the status by its number: ")
-        try:
-            if user not in statuses_num:
-                raise ValueError("Must be 1, 2, or 3")
-            return status_dict[user]
-        except ValueError:
-            print("Invalid input. Please enter 1, 2, or 3.")
\ No newline at end of file
+        # Validate and translate the choice in one lookup
+        status = _STATUS_MAP.get(_read("Enter the status by its number: "))
+        if status is not None:
+            return status
+        print("Invalid input. Please enter 1, 2, or 3.")
+
+def enter_confirmation(prompt):
+    """
+    Ask a yes/no question until the user gives a valid answer.
+    
+    Accepts 'yes'/'y' and 'no'/'n' in any letter case.
+    
+    :param prompt: The question to display
+    :return: True if the user confirmed, False otherwise
+    """
+    while True:
+        # Validate and translate the answer in one lookup
+        answer = _CONFIRM.get(_read(prompt).strip().lower())
+        if answer is not None:
+            return answer
+        print("Invalid input! Please enter 'yes' or 'no'.")
+
+
+# update_task menu numbers mapped to the Task field and the prompt reading its new value
+_UPDATE_FIELDS = {
+    "1": ("title", lambda: input("Enter new title: ")),
+    "2": ("description", lambda: input("Enter new description: ")),
+    "3": ("due_date", enter_date),
+    "4": ("priority", enter_priority),
+    "5": ("status", enter_status),
+}